@@ -8,7 +8,8 @@ from core.route.emissions import Emissions
 
 ELECTRIC = True
 
-if ELECTRIC:
+
+def _build_electrical_engine():
     # Crear instancia de Battery
     battery_instance = Battery(
         initial_capacity_ah=1225,
@@ -18,32 +19,46 @@ if ELECTRIC:
         min_state_of_health=80,
     )
 
-    engine_instance = ElectricalEngine(
+    return ElectricalEngine(
         max_power=240,
         efficiency=92,
         battery=battery_instance,
     )
 
-else:
+
+def _build_fuel_engine():
     # Crear una instancia de Fuel
-    fuel_instance = Fuel(fuel_type="diesel")
+    fuel_instance = Fuel.get(fuel_type="diesel")
 
     # Crear una instancia de Engine con el fuel
-    engine_instance = FuelEngine(
+    return FuelEngine(
         fuel=fuel_instance,
         max_power=200,  # kW
         efficiency=0.35,  # 0 a 1
     )
 
 
+ENGINE_BUILDERS = {
+    "electric": _build_electrical_engine,
+    "fuel": _build_fuel_engine,
+}
+
+
+def create_bus(engine_type):
+    """
+    Create a Bus with a new engine of the given type ('electric' or 'fuel').
+    """
+    return Bus(
+        mass=18000,
+        drag_coefficient=0.8,
+        frontal_area=13.0,
+        rolling_resistance_coefficient=0.01,
+        engine=ENGINE_BUILDERS[engine_type](),
+    )
+
+
 # Crear una instancia de Bus con el motor
-bus_instance = Bus(
-    mass=18000,
-    drag_coefficient=0.8,
-    frontal_area=13.0,
-    rolling_resistance_coefficient=0.01,
-    engine=engine_instance,
-)
+bus_instance = create_bus("electric" if ELECTRIC else "fuel")
 
 # Crear una instancia de Emissions con el estándar EURO deseado
 emissions_instance = Emissions(euro_standard="EURO_6")
@@ -1,4 +1,5 @@
 from core.bus.engine.base_engine import BaseEngine
+from utils.constants import AIR_DENSITY, GRAVITY
 
 
 class Bus:
@@ -6,6 +7,16 @@ class Bus:
     Class to represent a bus.
     """
 
+    __slots__ = (
+        "_mass",
+        "_drag_coefficient",
+        "_frontal_area",
+        "_rolling_resistance_coefficient",
+        "_engine",
+        "_k_aero",
+        "_k_roll",
+    )
+
     def __init__(
         self,
         mass,
@@ -35,6 +46,7 @@ class Bus:
         self._frontal_area = frontal_area
         self._rolling_resistance_coefficient = rolling_resistance_coefficient
         self.engine = engine  # Use the setter for validation
+        self._update_resistance_constants()
 
     @property
     def mass(self):
@@ -47,6 +59,7 @@ class Bus:
     def mass(self, value):
         if value > 0:
             self._mass = value
+            self._update_resistance_constants()
 
     @property
     def drag_coefficient(self):
@@ -59,6 +72,7 @@ class Bus:
     def drag_coefficient(self, value):
         if 0 < value < 1:  # typical values for drag coefficient
             self._drag_coefficient = value
+            self._update_resistance_constants()
 
     @property
     def frontal_area(self):
@@ -71,6 +85,7 @@ class Bus:
     def frontal_area(self, value):
         if value > 0:
             self._frontal_area = value
+            self._update_resistance_constants()
 
     @property
     def rolling_resistance_coefficient(self):
@@ -83,6 +98,31 @@ class Bus:
     def rolling_resistance_coefficient(self, value):
         if value > 0:
             self._rolling_resistance_coefficient = value
+            self._update_resistance_constants()
+
+    @property
+    def k_aero(self):
+        """
+        Aerodynamic constant 0.5 * rho * Cd * A in kg/m, so that the air
+        resistance is k_aero * v²
+        """
+        return self._k_aero
+
+    @property
+    def k_roll(self):
+        """
+        Rolling resistance force Crr * m * g in N
+        """
+        return self._k_roll
+
+    def _update_resistance_constants(self):
+        """
+        Recompute the constants derived from the bus characteristics.
+        """
+        self._k_aero = (
+            0.5 * AIR_DENSITY * self._drag_coefficient * self._frontal_area
+        )
+        self._k_roll = self._rolling_resistance_coefficient * self._mass * GRAVITY
 
     @property
     def engine(self):
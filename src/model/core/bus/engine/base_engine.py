@@ -1,11 +1,17 @@
+import numpy as np
+
+
 class BaseEngine:
     """
     BaseEngine class represents the base engine with common attributes and methods.
     """
 
+    __slots__ = ("_max_power", "_efficiency", "_inv_efficiency")
+
     def __init__(self, max_power, efficiency):
         self._max_power = max_power  # in Watts
         self._efficiency = efficiency  # in range [0, 1]
+        self._inv_efficiency = 1 / efficiency
 
     @property
     def max_power(self):
@@ -30,19 +36,22 @@ class BaseEngine:
     def efficiency(self, value):
         if 0 < value <= 1:
             self._efficiency = value
+            self._inv_efficiency = 1 / value
 
     def _adjust_power(self, power):
         """
         Adjust power based on max power and efficiency.
         """
-        if power <= self._max_power:
-            return power * self._efficiency
-        else:
-            return self._max_power * self._efficiency
+        return min(power, self._max_power) * self._efficiency
+
+    def _adjust_power_batch(self, power):
+        """
+        Adjust an array of powers based on max power and efficiency.
+        """
+        return np.minimum(np.asarray(power, dtype=np.float64), self._max_power) * self._efficiency
 
     def __str__(self):
         return (
-            f"Engine Type: {self.type}\n"
             f"Max Power: {self.max_power} W\n"
             f"Efficiency: {self.efficiency * 100} %"
         )
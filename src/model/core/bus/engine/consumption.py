@@ -0,0 +1,16 @@
+import math
+from typing import NamedTuple
+
+
+class Consumption(NamedTuple):
+    """
+    Consumption of an engine. The fields hold floats for a single section,
+    or NumPy arrays with one value per section for a whole route.
+    """
+
+    Wh: float
+    Ah: float
+    L_h: float  # litres per hour
+    L_km: float  # litres per kilometer
+    battery_degradation: float = 0.0
+    battery_state_of_charge: float = math.nan  # percentage, NaN without battery
@@ -0,0 +1,134 @@
+import math
+
+import numpy as np
+
+from utils.jit import njit
+
+# NOTE: adjust with numerical data
+SOC_FACTOR_SLOPE = 0.02
+CURRENT_FACTOR_SLOPE = 0.0002
+
+
+@njit(cache=True, nogil=True)
+def degradation_step(
+    soc_percent,
+    ah_transferred,
+    time_seconds,
+    capacity_ah,
+    initial_capacity_ah,
+    inv_max_cycles,
+    degradation_rate,
+    completed_cycles,
+):
+    """
+    Update the state of charge of a battery and apply its corresponding degradation.
+
+    Parameters
+    ----------
+    soc_percent : float
+        The state of charge before the section as a percentage.
+    ah_transferred : float
+        The amount of input or output charge in Ampere-hours.
+    time_seconds : float
+        The duration time of the section in seconds.
+    capacity_ah : float
+        The current capacity of the battery in Ampere-hours.
+    initial_capacity_ah : float
+        The initial capacity of the battery in Ampere-hours.
+    inv_max_cycles : float
+        Inverse of the maximum number of charge-discharge cycles of the battery.
+    degradation_rate : float
+        The fixed degradation rate per cycle.
+    completed_cycles : float
+        The number of cycles completed before the section.
+
+    Returns
+    -------
+    tuple
+        (soc_percent, completed_cycles, capacity_ah, degradation_in_section)
+        after the section.
+    """
+    # The SoC can not exceed the battery's capacity or drop below zero
+    soc_ah = capacity_ah * (soc_percent / 100)
+    updated_soc_ah = max(0.0, min(soc_ah - ah_transferred, capacity_ah))
+    updated_soc_percent = (updated_soc_ah / capacity_ah) * 100
+
+    # Electric current in Amperes, negative while charging
+    if time_seconds > 0:
+        electric_current = ah_transferred / (time_seconds / 3600)
+    else:
+        electric_current = 0.0
+    if electric_current < 0:
+        # Constant degradation before 80% charge, linear increase after it
+        if updated_soc_percent < 80:
+            soc_factor = 1.005
+        else:
+            soc_factor = 1.005 + SOC_FACTOR_SLOPE * (updated_soc_percent - 80)
+        current_factor = 1 + CURRENT_FACTOR_SLOPE * electric_current
+    else:
+        # Constant degradation above 20% charge, linear increase below it
+        if updated_soc_percent > 20:
+            soc_factor = 1.05
+        else:
+            soc_factor = 1.05 + SOC_FACTOR_SLOPE * (20 - updated_soc_percent)
+        current_factor = 1 + CURRENT_FACTOR_SLOPE * abs(electric_current)
+
+    # Completed cycles based on the SoC change, weighted by both factors
+    cycle_increment = math.fabs(soc_percent - updated_soc_percent) * 0.01
+    completed_cycles += cycle_increment * (soc_factor * current_factor)
+    degradation_in_section = cycle_increment * inv_max_cycles
+
+    # Capacity of the battery after the degradation
+    capacity_ah = initial_capacity_ah * (1 - completed_cycles * degradation_rate)
+
+    return updated_soc_percent, completed_cycles, capacity_ah, degradation_in_section
+
+
+@njit(cache=True, nogil=True)
+def degradation_steps(
+    ah_transferred,
+    time_seconds,
+    soc_percent,
+    capacity_ah,
+    initial_capacity_ah,
+    inv_max_cycles,
+    degradation_rate,
+    completed_cycles,
+):
+    """
+    Apply `degradation_step` to consecutive sections, in order.
+
+    Parameters
+    ----------
+    ah_transferred : np.ndarray
+        The amount of input or output charge of each section in Ampere-hours.
+    time_seconds : np.ndarray
+        The duration time of each section in seconds.
+    The rest of parameters are the state of the battery, as in `degradation_step`.
+
+    Returns
+    -------
+    tuple
+        (degradation, state_of_charge, soc_percent, capacity_ah, completed_cycles),
+        with the degradation and the state of charge after each section, and the
+        state after the last one.
+    """
+    n_sections = ah_transferred.shape[0]
+    degradation = np.empty(n_sections)
+    state_of_charge = np.empty(n_sections)
+    for i in range(n_sections):
+        soc_percent, completed_cycles, capacity_ah, degradation_in_section = (
+            degradation_step(
+                soc_percent,
+                ah_transferred[i],
+                time_seconds[i],
+                capacity_ah,
+                initial_capacity_ah,
+                inv_max_cycles,
+                degradation_rate,
+                completed_cycles,
+            )
+        )
+        degradation[i] = degradation_in_section
+        state_of_charge[i] = soc_percent
+    return degradation, state_of_charge, soc_percent, capacity_ah, completed_cycles
@@ -1,4 +1,8 @@
+import numpy as np
+
 from core.bus.engine.base_engine import BaseEngine
+from core.bus.engine.consumption import Consumption
+from utils.constants import HOURS_PER_SECOND
 
 
 class ElectricalEngine(BaseEngine):
@@ -6,6 +10,8 @@ class ElectricalEngine(BaseEngine):
     ElectricalEngine class represents an electric engine.
     """
 
+    __slots__ = ("battery",)
+
     def __init__(self, max_power, efficiency, battery):
         super().__init__(max_power, efficiency)
         self.battery = battery
@@ -14,25 +20,53 @@ class ElectricalEngine(BaseEngine):
     def battery_state_of_health(self):
         return self.battery.state_of_health
 
-    def consumption(self, power, time, km=None):
+    def consumption(self, power, time, km=0.0) -> Consumption:
         """
         Calculate electric consumption in Wh.
         """
         power = self._adjust_power(power)
-        hours = time / 3600  # convert seconds to hours
+        hours = time * HOURS_PER_SECOND  # convert seconds to hours
 
         # Compute consumption in Wh and Ah
         watts_hour = power * hours
-        ampers_hour = watts_hour / self.battery.voltage_v
+        ampers_hour = watts_hour * self.battery.inv_voltage
 
         self.battery.update_soc_and_degradation(ampers_hour, time)
 
-        return {
-            "Wh": watts_hour,
-            "Ah": ampers_hour,
-            "L/h": 0,  # 0 for ElectricalEngine
-            "L/km": 0,  # "" "" ""
-        }
+        return Consumption(
+            Wh=watts_hour,
+            Ah=ampers_hour,
+            L_h=0.0,  # 0 for ElectricalEngine
+            L_km=0.0,  # "" "" ""
+            battery_degradation=self.battery.degradation_in_section,
+            battery_state_of_charge=self.battery.state_of_charge_percent,
+        )
+
+    def consumption_batch(self, power, time, km=0.0) -> Consumption:
+        """
+        Calculate electric consumption in Wh for a whole trajectory.
+
+        The battery is updated section by section, in order, as in `consumption`.
+        Returns the same fields as `consumption`, holding one value per section.
+        """
+        power = self._adjust_power_batch(power)
+        time = np.asarray(time, dtype=np.float64)
+
+        # Compute consumption in Wh and Ah
+        watts_hour = power * time * HOURS_PER_SECOND
+        ampers_hour = watts_hour * self.battery.inv_voltage
+
+        degradation, state_of_charge = self.battery.step_many(ampers_hour, time)
+
+        zeros = np.zeros_like(watts_hour)
+        return Consumption(
+            Wh=watts_hour,
+            Ah=ampers_hour,
+            L_h=zeros,  # 0 for ElectricalEngine
+            L_km=zeros,  # "" "" ""
+            battery_degradation=degradation,
+            battery_state_of_charge=state_of_charge,
+        )
 
     def get_battery_state_of_charge(self):
         return self.battery.state_of_charge_percent
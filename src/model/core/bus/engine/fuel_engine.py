@@ -1,5 +1,9 @@
+import numpy as np
+
 from core.bus.engine.base_engine import BaseEngine
+from core.bus.engine.consumption import Consumption
 from core.bus.fuel import Fuel
+from utils.constants import HOURS_PER_SECOND
 
 
 class FuelEngine(BaseEngine):
@@ -7,6 +11,8 @@ class FuelEngine(BaseEngine):
     Represents a combustion engine.
     """
 
+    __slots__ = ("_fuel",)
+
     def __init__(self, max_power, efficiency, fuel):
         """
         Initialize a FuelEngine with the maximum power, efficiency, and fuel.
@@ -35,34 +41,71 @@ class FuelEngine(BaseEngine):
         else:
             raise ValueError("fuel must be an instance of Fuel")
 
-    def consumption(self, power, time, km) -> dict[str, float]:
+    def consumption(self, power, time, km=0.0) -> Consumption:
         """
         Calculate fuel consumption.
 
         Args:
             power (float): The power demand in Watts.
             time (float): The time period over which the power is applied in seconds.
-            km (float, optional): The distance covered in kilometers (if available).
+            km (float, optional): The distance covered in kilometers. 0 when it
+                is not available, which gives an L_km of 0.
 
         Returns:
-            dict[str, float]: A dictionary containing:
-                - "Wh": Always 0 for a combustion engine.
-                - "L/h": Liters of fuel consumed per hour.
-                - "L/km": Liters of fuel consumed per kilometer (if distance provided).
+            Consumption: A named tuple containing:
+                - Wh, Ah: Always 0 for a combustion engine.
+                - L_h: Liters of fuel consumed per hour.
+                - L_km: Liters of fuel consumed per kilometer.
+                - battery_degradation: Always 0, there is no battery.
+                - battery_state_of_charge: Always NaN, there is no battery.
         """
         power = self._adjust_power(power)
-        lhv = self.fuel.lhv  # Lower Heating Value of the fuel
+        inv_lhv = self.fuel.inv_lhv  # Inverse of the Lower Heating Value of the fuel
 
         # Calculate the energy used
-        energy = (power * time) / self._efficiency
+        energy = power * time * self._inv_efficiency
         # Calculate fuel consumption in liters
-        litres = energy / lhv
+        litres = energy * inv_lhv
+
+        return Consumption(
+            Wh=0.0,  # always 0 for combustion engines
+            Ah=0.0,  # ""    ""  ""  ""          ""
+            L_h=litres / (time * HOURS_PER_SECOND),  # Convert time from seconds to hours
+            L_km=litres / km if km > 0 else 0.0,  # 0 for a zero-length section
+        )
+
+    def consumption_batch(self, power, time, km=0.0) -> Consumption:
+        """
+        Calculate fuel consumption for a whole trajectory at once.
+
+        Args:
+            power (array-like): The power demand of each section in Watts.
+            time (array-like): The duration of each section in seconds.
+            km (array-like, optional): The distance covered in each section in
+                kilometers, with 0 where it is not available.
+
+        Returns:
+            Consumption: The same fields as `consumption`, holding one value
+            per section.
+        """
+        power = self._adjust_power_batch(power)
+        time = np.asarray(time, dtype=np.float64)
+        km = np.asarray(km, dtype=np.float64)
+
+        # Calculate the energy used and the fuel consumption in liters
+        energy = power * time * self._inv_efficiency
+        litres = energy * self.fuel.inv_lhv
 
-        consumption = {
-            "Wh": 0,  # always 0 for combustion engines
-            "Ah": 0,  # ""    ""  ""  ""          ""
-            "L/h": litres / (time / 3600),  # Convert time from seconds to hours
-            "L/km": litres / km,
-        }
+        zeros = np.zeros_like(litres)
+        return Consumption(
+            Wh=zeros,  # always 0 for combustion engines
+            Ah=zeros,  # ""    ""  ""  ""          ""
+            L_h=litres / (time * HOURS_PER_SECOND),  # Convert time from seconds to hours
+            # 0 for zero-length sections (repeated points) instead of inf/nan
+            L_km=np.divide(litres, km, out=np.zeros_like(litres), where=km > 0),
+            battery_degradation=zeros,  # no battery in combustion engines
+            battery_state_of_charge=np.full_like(litres, np.nan),
+        )
 
-        return consumption
+    def __str__(self):
+        return f"Engine Type: Fuel ({self.fuel.fuel_type})\n" + super().__str__()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from utils.constants import fuels_lhv
 
 
@@ -6,6 +8,8 @@ class Fuel:
     Class representing a fuel type.
     """
 
+    __slots__ = ("_fuel_type", "_lhv", "_inv_lhv")
+
     def __init__(self, fuel_type, lhv=None):
         """
         Initialize a Fuel instance.
@@ -18,13 +22,19 @@ class Fuel:
             The Lower Heating Value of the fuel in J/L.
         """
         self._fuel_type = fuel_type
-        if fuel_type in fuels_lhv:
-            self._lhv = fuels_lhv[fuel_type]
-        else:
-            if lhv:
-                self._lhv = lhv
-            else:
-                raise ValueError("You must provide the LHV for this fuel type")
+        self._lhv = fuels_lhv.get(fuel_type, lhv)
+        if not self._lhv:
+            raise ValueError("You must provide the LHV for this fuel type")
+        self._inv_lhv = 1 / self._lhv
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get(cls, fuel_type, lhv=None):
+        """
+        Return a shared Fuel instance for the given fuel type.
+        Fuel instances are immutable, so they can be reused between engines.
+        """
+        return cls(fuel_type, lhv)
 
     @property
     def fuel_type(self):
@@ -39,3 +49,10 @@ class Fuel:
         Lower Heating Volume of the fuel in J/L.
         """
         return self._lhv
+
+    @property
+    def inv_lhv(self):
+        """
+        Inverse of the Lower Heating Value of the fuel in L/J.
+        """
+        return self._inv_lhv
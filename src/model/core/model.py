@@ -1,12 +1,46 @@
 import csv
 import os
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
 from core.route.route import Route
 
 
 class Model:
+    # Columns read from the input file in each mode, and their names
+    _COLUMNS = {
+        "real": (
+            [2, 3, 4, 6, 8, 9],
+            ["time", "latitude", "longitude", "altitude", "distance", "speed"],
+        ),
+        "simulation": (
+            [0, 1, 2, 3],
+            ["latitude", "longitude", "altitude", "speed_limit"],
+        ),
+    }
+
+    # Columns of the output file
+    _OUTPUT_HEADER = (
+        "start",
+        "end",
+        "start_time",
+        "end_time",
+        "start_speed",
+        "end_speed",
+        "Wh",
+        "Ah",
+        "L/h",
+        "L/km",
+        "NOx",
+        "CO",
+        "HC",
+        "PM",
+        "CO2",
+        "battery_degradation",
+    )
+
     def __init__(self, name: str, filepath: str, bus, emissions, mode: str):
         """
         Initialize a Model instance.
@@ -22,9 +56,12 @@ class Model:
         self._validate_mode(mode)
         self._validate_filepath(filepath)
         self._output_dir = self._create_output_dir(name)
+        self._output_file = os.path.join(self._output_dir, "output.csv")
 
         self._mode = mode
-        self._data = self._load_data(filepath, mode)
+        # Absolute path as the cache key, a relative one depends on the current directory
+        filepath = os.path.abspath(filepath)
+        self._data = self._load_data(filepath, os.path.getmtime(filepath), mode)
         self.route = Route(
             data=self._data, bus=bus, emissions=emissions, mode=self._mode
         )
@@ -33,50 +70,49 @@ class Model:
         """
         Calculate and save the consumption and emissions data to an output CSV file.
         """
-        filename = os.path.join(self._output_dir, "output.csv")
-
-        # Prepare header and data rows
-        header = [
-            "start",
-            "end",
-            "start_time",
-            "end_time",
-            "start_speed",
-            "end_speed",
-            "Wh",
-            "Ah",
-            "L/h",
-            "L/km",
-            "NOx",
-            "CO",
-            "HC",
-            "PM",
-            "CO2",
-            "battery_degradation",
-        ]
-        rows = []
-
-        for sect in self.route.sections:
-            sect_emissions = [float(value) for value in sect.section_emissions.values()]
-            sect_consumption = [float(value) for value in sect.consumption.values()]
-
-            row = [
-                sect.start,
-                sect.end,
-                sect.start_time,
-                sect.end_time,
-                sect.start_speed,
-                sect.end_speed,
-                *sect_consumption,
-                *sect_emissions,
-                sect.get_battery_degradation_in_section(),
-            ]
-            rows.append(row)
+        arrays = self.route.arrays
+        power = arrays.instant_power
+        duration_time = arrays.duration_time
+
+        # Consumption and emissions of every section at once
+        consumption = self.route.bus.engine.consumption_batch(
+            power=power, time=duration_time, km=arrays.length / 1000
+        )
+        # gonna be 0 when ElectricalEngine, so will not interfere
+        fuel_consumption_rate = consumption.L_km / duration_time
+        emissions = self.route.emissions.calculate_emissions_batch(
+            power / 1000, fuel_consumption_rate
+        )
+        # Kept on the route to describe each section, see Route.describe_sections
+        self.route.consumption = consumption
+        self.route.section_emissions = emissions
+
+        values = np.column_stack(
+            (
+                arrays.start_time,
+                arrays.end_time,
+                arrays.start_speed,
+                arrays.end_speed,
+                consumption.Wh,
+                consumption.Ah,
+                consumption.L_h,
+                consumption.L_km,
+                emissions,
+                consumption.battery_degradation,
+            )
+        )
+        # Rows are converted to Python lists while writing, so only one is held in
+        # memory at a time. Section i goes from point i to point i + 1 of the route
+        points = self.route.points
+        rows = (
+            [start, end, *row.tolist()]
+            for start, end, row in zip(points, points[1:], values)
+        )
 
         # Write to CSV file
-        with open(filename, "w", newline="") as f:
+        with open(self._output_file, "w", newline="", buffering=1 << 20) as f:
             writer = csv.writer(f, delimiter=";")
-            writer.writerow(header)
+            writer.writerow(self._OUTPUT_HEADER)
             writer.writerows(rows)
 
     def plot_combined_profiles(self):
@@ -105,31 +141,38 @@ class Model:
         if not filepath.endswith(".csv"):
             raise ValueError("Unsupported file format. Only .csv is supported.")
 
-    def _load_data(self, filepath: str, mode: str) -> pd.DataFrame:
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _load_data(filepath: str, mtime: float, mode: str) -> pd.DataFrame:
         """
         Load and process data from a CSV file based on the mode.
+        The result is cached, using the modification time of the file so that
+        an edited file is read again. It must not be modified in place.
 
         Returns
         --------
         pd.DataFrame: Processed data as a DataFrame.
         """
-        df = pd.read_csv(filepath)
+        # Only parse the columns that are used
+        usecols, names = Model._COLUMNS[mode]
+        df = pd.read_csv(filepath, usecols=usecols, dtype=np.float64)
+        df.columns = names
         if mode == "real":
-            return self._process_real_data(df)
+            return Model._process_real_data(df)
         elif mode == "simulation":
-            return self._process_simulation_data(df)
+            return Model._process_simulation_data(df)
 
     @staticmethod
     def _process_real_data(df: pd.DataFrame) -> pd.DataFrame:
         """
         Process data to work in real mode, so it gets real values for speed & time
         """
-        df = df.iloc[:, [2, 3, 4, 6, 8, 9]]
-        df.columns = ["time", "latitude", "longitude", "altitude", "distance", "speed"]
-
         # Check and handle the first non-zero time entry
-        if df.iloc[0]["time"] == 0:
-            first_non_zero_index = df[df["time"] != 0].index[0]
+        time = df["time"].to_numpy()
+        if time[0] == 0:
+            first_non_zero_index = int(np.argmax(time != 0))
+            if first_non_zero_index == 0:
+                raise ValueError("The time column of the data has no non-zero values.")
             df = df.iloc[first_non_zero_index - 1 :]
 
         return df
@@ -143,9 +186,7 @@ class Model:
         --------
         pd.DataFrame: Processed data as a DataFrame ready for simulation.
         """
-        # Suponiendo que las columnas relevantes están presentes en el archivo CSV
-        df.columns = ["latitude", "longitude", "altitude", "speed_limit"]
-        
+        # Las columnas ya se han seleccionado y nombrado en _load_data
         return df
 
     def _create_output_dir(self, dir_name):
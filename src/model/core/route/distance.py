@@ -0,0 +1,40 @@
+import math
+
+import numpy as np
+
+from utils.constants import EARTH_RADIUS
+
+
+def haversine(start, end) -> float:
+    """
+    Great-circle distance in meters between two (latitude, longitude) points in degrees.
+    """
+    lat_0, long_0 = math.radians(start[0]), math.radians(start[1])
+    lat_1, long_1 = math.radians(end[0]), math.radians(end[1])
+
+    a = (
+        math.sin((lat_1 - lat_0) / 2) ** 2
+        + math.cos(lat_0) * math.cos(lat_1) * math.sin((long_1 - long_0) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(a))
+
+
+def haversine_batch(latitudes, longitudes) -> np.ndarray:
+    """
+    Great-circle distances in meters between consecutive points of a route.
+
+    Args:
+        latitudes (array-like): Latitudes of the route points in degrees.
+        longitudes (array-like): Longitudes of the route points in degrees.
+
+    Returns:
+        np.ndarray: Array with the length of each of the n - 1 segments.
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    long = np.radians(np.asarray(longitudes, dtype=np.float64))
+
+    a = (
+        np.sin(np.diff(lat) / 2) ** 2
+        + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(long) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
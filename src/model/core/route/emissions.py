@@ -1,3 +1,5 @@
+import numpy as np
+
 from utils.constants import CO2_CONVERSION_FACTOR, euro_standards
 
 
@@ -6,6 +8,8 @@ class Emissions:
     Class to calculate emissions based on the EURO standard.
     """
 
+    __slots__ = ("euro_standard", "standards", "_pollutant_names", "_factors")
+
     def __init__(self, euro_standard):
         """
         Initialize an Emissions instance with the EURO standard.
@@ -20,6 +24,15 @@ class Emissions:
         self.euro_standard = euro_standard
         self.standards = euro_standards[euro_standard]
 
+        # Pollutant names and their g/kWh -> g/s per kW conversion factors
+        self._pollutant_names = tuple(self.standards.keys())
+        self._factors = np.array(list(self.standards.values()), dtype=np.float64) / 3600
+
+    @property
+    def pollutant_names(self) -> tuple[str, ...]:
+        """Names of the columns returned by `calculate_emissions_batch`."""
+        return self._pollutant_names + ("CO2",)
+
     @staticmethod
     def _validate_euro_standard(euro_standard):
         if euro_standard not in euro_standards:
@@ -44,10 +57,31 @@ class Emissions:
         """
         Calculate emissions for NOx, CO, HC, and PM based on the given power in kW.
         """
-        return {
-            pollutant: value * power_kw / 3600  # converting g/kWh to g/s
-            for pollutant, value in self.standards.items()
-        }
+        return dict(zip(self._pollutant_names, self._factors * power_kw))
+
+    def calculate_emissions_batch(self, power_kw, fuel_consumption_rate):
+        """
+        Calculate emissions for a whole trajectory at once.
+
+        Parameters
+        ----------
+        power_kw : array-like
+            Power of each section in kW.
+        fuel_consumption_rate : array-like
+            Fuel consumption rate of each section in liters per second.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_sections, n_pollutants + 1) with the emissions in grams
+            per second, with the columns ordered as the standard's pollutants followed by CO2.
+        """
+        power_kw = np.asarray(power_kw, dtype=np.float64)
+        fuel_consumption_rate = np.asarray(fuel_consumption_rate, dtype=np.float64)
+
+        pollutants = power_kw[:, None] * self._factors[None, :]
+        co2 = self._calculate_co2_emissions(fuel_consumption_rate)
+        return np.column_stack((pollutants, co2))
 
     def _calculate_co2_emissions(self, fuel_consumption_rate):
         """
@@ -0,0 +1,33 @@
+import math
+
+import numpy as np
+
+from utils.jit import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def section_power(total_resistance, length, grade_angle, duration_time):
+    """
+    Calculate the instantaneous power (W) of every section of a route.
+
+    Args:
+        total_resistance (np.ndarray): Total resistance of each section in N.
+        length (np.ndarray): Length of each section in meters.
+        grade_angle (np.ndarray): Grade angle of each section in degrees.
+        duration_time (np.ndarray): Duration of each section in seconds.
+
+    Returns:
+        np.ndarray: Power required in each section in Watts, 0 in the sections
+        without duration.
+    """
+    n_sections = total_resistance.shape[0]
+    # float64 result even when the inputs are float32
+    power = np.empty(n_sections, dtype=np.float64)
+    for i in prange(n_sections):
+        work = total_resistance[i] * length[i] * math.cos(math.radians(grade_angle[i]))
+        # fastmath would silently give inf or NaN for a zero duration
+        if duration_time[i] > 0:
+            power[i] = work / duration_time[i]
+        else:
+            power[i] = 0.0
+    return power
@@ -1,6 +1,6 @@
 import math
 
-from utils.constants import AIR_DENSITY, GRAVITY
+from utils.constants import GRAVITY
 
 
 class ResistanceCalculator:
@@ -8,6 +8,8 @@ class ResistanceCalculator:
     Calculate the resistances of a section of a route.
     """
 
+    __slots__ = ("bus", "average_speed", "acceleration", "grade_angle")
+
     def __init__(self, bus, average_speed, acceleration, grade_angle):
         """
         Initialize a ResistanceCalculator with a bus, average speed, acceleration, and grade angle.
@@ -28,13 +30,7 @@ class ResistanceCalculator:
         """
         Calculate the air resistance of the section.
         """
-        return (
-            0.5
-            * AIR_DENSITY
-            * self.bus.drag_coefficient
-            * self.bus.frontal_area
-            * self.average_speed**2
-        )
+        return self.bus.k_aero * self.average_speed**2
 
     @property
     def inertia(self):
@@ -55,7 +51,7 @@ class ResistanceCalculator:
         """
         Calculate the rolling resistance of the section.
         """
-        return self.bus.rolling_resistance_coefficient * self.bus.mass * GRAVITY
+        return self.bus.k_roll
 
     @property
     def total_resistance(self):
@@ -1,12 +1,19 @@
+import logging
 import os
 
-import folium
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+from core.route.distance import haversine_batch
+from core.route.route_arrays import RouteArrays
 from core.route.section.simulated_section import SimulatedSection
 from core.route.section.real_section import RealSection
 
+# matplotlib and folium are imported inside the plotting methods: they are slow
+# to import and not needed to compute consumption and emissions
+
+logger = logging.getLogger(__name__)
+
 
 class Route:
     """
@@ -26,14 +33,23 @@ class Route:
         self._mode = mode
         self.bus = bus
         self.emissions = emissions
-        self.sections = self._create_sections(data)
-
-    def _create_sections(self, df: pd.DataFrame) -> list:
+        if mode == "real":
+            data = self._merge_zero_duration_sections(data)
+        self.arrays = RouteArrays(max(data.shape[0] - 1, 0))
+        # Points of the route; section i goes from points[i] to points[i + 1]
+        self.points, lengths = self._route_geometry(data)
+        self.sections = self._create_sections(data, lengths)
+        # Results of every section, set by Model.consumption_and_emissions
+        self.consumption = None
+        self.section_emissions = None
+
+    def _create_sections(self, df: pd.DataFrame, lengths: list) -> list:
         """
         Creates the sections of the route based on the mode.
 
         Args:
             df (pd.DataFrame): DataFrame containing route information.
+            lengths (list): Length in meters of each section.
 
         Returns:
             list: A list of sections created for the route.
@@ -42,53 +58,91 @@ class Route:
             ValueError: If the mode is invalid.
         """
         if self._mode == "real":
-            return self._process_real_sections(df)
+            return self._process_real_sections(df, lengths)
         elif self._mode == "simulation":
-            return self._process_simulated_sections(df)
+            return self._process_simulated_sections(df, lengths)
         else:
             raise ValueError("Invalid mode. Mode should be 'real' or 'simulation'.")
 
-    def _process_real_sections(self, df: pd.DataFrame) -> list:
+    @staticmethod
+    def _merge_zero_duration_sections(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Drop the points whose time is not later than every point before them.
+
+        A section with zero or negative duration has no meaningful power or
+        electric current, so it is merged into the next one, which then starts
+        at the last point kept.
+
+        Args:
+            df (pd.DataFrame): DataFrame containing route information.
+
+        Returns:
+            pd.DataFrame: The route data with strictly increasing times.
+        """
+        time = df["time"].to_numpy()
+        keep = np.empty(len(time), dtype=bool)
+        keep[:1] = True
+        # Compare with the latest time so far, not just the previous point, so a
+        # timestamp going backwards does not leave a negative duration section
+        np.greater(time[1:], np.maximum.accumulate(time)[:-1], out=keep[1:])
+        if keep.all():
+            return df
+        logger.warning(
+            "Dropped %d points without a later time than the previous ones",
+            len(keep) - np.count_nonzero(keep),
+        )
+        return df[keep]
+
+    @staticmethod
+    def _route_geometry(df: pd.DataFrame) -> tuple[list, list]:
+        """
+        Extract the route points and the length of every section.
+
+        Args:
+            df (pd.DataFrame): DataFrame containing route information.
+
+        Returns:
+            tuple: A list of (latitude, longitude, altitude) tuples and a list with
+            the length in meters of each of the sections between them.
+        """
+        coordinates = df[["latitude", "longitude", "altitude"]].to_numpy(dtype=float)
+        points = [tuple(point) for point in coordinates.tolist()]
+        lengths = haversine_batch(coordinates[:, 0], coordinates[:, 1]).tolist()
+        return points, lengths
+
+    def _process_real_sections(self, df: pd.DataFrame, lengths: list) -> list:
         """
         Process sections when working in real mode
         """
         sections = []
-        for i in range(df.shape[0] - 1):
-            start_section = df.iloc[i, :]
-            end_section = df.iloc[i + 1, :]
-
-            start_time = start_section["time"]
-            end_time = end_section["time"]
-            timestamps = (start_time, end_time)
-
-            start_speed = start_section["speed"]
-            end_speed = end_section["speed"]
-            speeds = (start_speed, end_speed)
-
-            start_coord = (
-                float(start_section["latitude"]),
-                float(start_section["longitude"]),
-                float(start_section["altitude"]),
-            )
-            end_coord = (
-                float(end_section["latitude"]),
-                float(end_section["longitude"]),
-                float(end_section["altitude"]),
-            )
-            coordinates = (start_coord, end_coord)
+        points = self.points
+        times = df["time"].to_numpy(dtype=float).tolist()
+        speeds_list = df["speed"].to_numpy(dtype=float).tolist()
+
+        for i in range(len(points) - 1):
+            timestamps = (times[i], times[i + 1])
+            speeds = (speeds_list[i], speeds_list[i + 1])
+            coordinates = (points[i], points[i + 1])
 
             section = RealSection(
-                coordinates, speeds, timestamps, self.bus, self.emissions
+                coordinates,
+                speeds,
+                timestamps,
+                self.bus,
+                self.emissions,
+                length=lengths[i],
             )
+            self.arrays.set_section(i, section)
             sections.append(section)
         return sections
 
-    def _process_simulated_sections(self, df: pd.DataFrame) -> list:
+    def _process_simulated_sections(self, df: pd.DataFrame, lengths: list) -> list:
         """
         Process sections when working in simulation mode.
 
         Args:
             df (pd.DataFrame): DataFrame containing route information.
+            lengths (list): Length in meters of each section.
 
         Returns:
             list: A list of simulated sections created for the route.
@@ -98,25 +152,17 @@ class Route:
         next_initial_speed = 0
         cumulative_time = 0
 
-        # Create an instance of SimulatedSection for each segment
-        for i in range(df.shape[0] - 1):
+        # Read the route columns once instead of indexing the DataFrame row by row
+        points = self.points
+        limits = df["speed_limit"].to_numpy().astype(int).tolist()
 
-            start_section = df.iloc[i, :]
-            end_section = df.iloc[i + 1, :]
+        # Create an instance of SimulatedSection for each segment. The sections are
+        # processed in order since each start speed depends on the previous section
+        for i in range(len(points) - 1):
 
-            start_coord = (
-                float(start_section["latitude"]),
-                float(start_section["longitude"]),
-                float(start_section["altitude"]),
-            )
-            end_coord = (
-                float(end_section["latitude"]),
-                float(end_section["longitude"]),
-                float(end_section["altitude"]),
-            )
-            coordinates = (start_coord, end_coord)
+            coordinates = (points[i], points[i + 1])
 
-            limit = int(end_section["speed_limit"])
+            limit = limits[i + 1]
             
             # Set the start time for the section
             start_time = cumulative_time
@@ -126,7 +172,8 @@ class Route:
 
             # Create a SimulatedSection instance
             seccion = SimulatedSection(
-                coordinates, limit, initial_speed, start_time, self.bus, self.emissions)
+                coordinates, limit, initial_speed, start_time, self.bus, self.emissions,
+                length=lengths[i])
             
             # Update the initial speed for the next section
             next_initial_speed = seccion.end_speed
@@ -137,26 +184,56 @@ class Route:
             # Update the end speed for the actual section
             if secciones:
                 secciones[-1].end_speed = actual_initial_speed
+                self.arrays.end_speed[i - 1] = actual_initial_speed
 
             # Update the cumulative time
             cumulative_time = seccion.end_time
 
+            # Store the section results
+            self.arrays.set_section(i, seccion)
+
             # Append the section to the list
             secciones.append(seccion)
-        
-        # Consolidate results
-        velocities = []
-        start_times = []
-        end_times = []
-        
-        for seccion in secciones:
-            velocities.extend(seccion.velocities)
-            start_times.append(seccion.start_time)
-            end_times.append(seccion.end_time)
-
-        # Return consolidated results along with the section start and end times
+
         return secciones
     
+    def describe_sections(self) -> list[str]:
+        """
+        Describe every section with its consumption and emissions, once they have
+        been computed, and the state of the battery after it when there is one.
+
+        Returns:
+            list: One string per section.
+        """
+        if self.consumption is None:
+            return [str(section) for section in self.sections]
+
+        names = self.emissions.pollutant_names
+        has_battery = getattr(self.bus.engine, "battery", None) is not None
+        descriptions = []
+        for i, section in enumerate(self.sections):
+            consumption = self.consumption._make(
+                float(values[i]) for values in self.consumption
+            )
+            emissions_str = "\n".join(
+                [
+                    f"{name}: {value:.6f} g/s"
+                    for name, value in zip(names, self.section_emissions[i].tolist())
+                ]
+            )
+            description = (
+                f"{section}"
+                f"\nConsumption: {consumption}"
+                f"\n\nEmissions:\n{emissions_str}\n"
+            )
+            if has_battery:
+                description += (
+                    f"\nBattery SoC: {consumption.battery_state_of_charge}"
+                    f"\nBattery degradation:{consumption.battery_degradation}\n"
+                )
+            descriptions.append(description)
+        return descriptions
+
     def plot_altitude_profile(self, output_dir: str):
         """
         Plots the altitude profile of the route based on distance.
@@ -167,6 +244,8 @@ class Route:
         output_dir: str
             The output directory
         """
+        import matplotlib.pyplot as plt
+
         # Lists to store the distances and altitudes
         distances = []
         altitudes = []
@@ -223,6 +302,8 @@ class Route:
         output_dir: str
             The output directory
         """
+        import matplotlib.pyplot as plt
+
 
         # Lists to store the distances and speeds
         distances = []
@@ -281,6 +362,8 @@ class Route:
         output_dir: str
             The output directory
         """
+        import matplotlib.pyplot as plt
+
         # Lists to store the distances and accelerations
         distances = []
         accelerations = []
@@ -293,8 +376,8 @@ class Route:
         # Process each section
         for section in self.sections:
 
-            # Assuming _acceleration is a constant value for each section
-            acceleration = section._acceleration
+            # Assuming acceleration is a constant value for each section
+            acceleration = section.acceleration
 
             # Add the start and end distances and accelerations to the lists
             distances.append(accumulated_distance)
@@ -335,44 +418,21 @@ class Route:
         """
         Combines the altitude, speed, and acceleration profiles in a single plot.
         """
-        # Lists to store the data
-        distances = []
-        altitudes = []
-        speeds = []
-        accelerations = []
-        markers_distance = []
-        markers_altitude = []
-        markers_acceleration = []
+        import matplotlib.pyplot as plt
 
-        # Variable to track the accumulated distance
-        accumulated_distance = 0
+        arrays = self.arrays
 
-        # Process each section
-        for section in self.sections:
-            # Altitude
-            start_altitude = section.start[2]
-            end_altitude = section.end[2]
-            distances.extend(
-                [accumulated_distance, accumulated_distance + section.length]
-            )
-            altitudes.extend([start_altitude, end_altitude])
-            markers_distance.extend(
-                [accumulated_distance, accumulated_distance + section.length]
-            )
-            markers_altitude.extend([start_altitude, end_altitude])
+        # Each section contributes its start and end point to the profiles
+        end_distances = arrays.cumulative_distance
+        start_distances = end_distances - arrays.length
+        distances = np.column_stack((start_distances, end_distances)).ravel()
+        altitudes = np.column_stack((arrays.start_altitude, arrays.end_altitude)).ravel()
+        speeds = np.column_stack((arrays.start_speed, arrays.end_speed)).ravel()
+        accelerations = np.repeat(arrays.acceleration, 2)
 
-            # Speed
-            start_speed = section.start_speed
-            end_speed = section.end_speed
-            speeds.extend([start_speed, end_speed])
-
-            # Acceleration
-            acceleration = section.acceleration
-            accelerations.extend([acceleration, acceleration])
-            markers_acceleration.extend([acceleration, acceleration])
-
-            # Update the accumulated distance
-            accumulated_distance += section.length
+        markers_distance = distances
+        markers_altitude = altitudes
+        markers_acceleration = accelerations
 
         # Create the figure and axes for the subplots
         _, axs = plt.subplots(3, 1, figsize=(10, 15), sharex=True)
@@ -420,6 +480,8 @@ class Route:
         """
         Plots the route on an interactive map using folium.
         """
+        import folium
+
         # Create a folium map centered on the first coordinate
         if not self.sections:
             raise ValueError("No sections available to plot on the map.")
@@ -0,0 +1,90 @@
+import numpy as np
+
+from core.route.power import section_power
+
+
+class RouteArrays:
+    """
+    Structure-of-arrays view of the sections of a route.
+    Each attribute is a NumPy array with one value per section.
+
+    The per-section physical quantities are stored as float32, which is more than
+    enough precision for them. Speeds and times stay float64: times are running
+    sums over the whole route and both are written as-is to the output.
+    """
+
+    __slots__ = (
+        "length",
+        "grade_angle",
+        "start_altitude",
+        "end_altitude",
+        "start_speed",
+        "end_speed",
+        "average_speed",
+        "start_time",
+        "end_time",
+        "acceleration",
+        "total_resistance",
+    )
+
+    _FLOAT64 = frozenset(
+        ("start_speed", "end_speed", "average_speed", "start_time", "end_time")
+    )
+
+    def __init__(self, n_sections: int):
+        """
+        Allocate the arrays for a route with the given number of sections.
+
+        Args:
+            n_sections (int): Number of sections of the route.
+        """
+        for name in self.__slots__:
+            dtype = np.float64 if name in self._FLOAT64 else np.float32
+            setattr(self, name, np.zeros(n_sections, dtype=dtype))
+
+    def __len__(self):
+        return len(self.length)
+
+    def set_section(self, index: int, section) -> None:
+        """
+        Store the values of a section in the given position.
+
+        Args:
+            index (int): Position of the section in the route.
+            section: Instance of a BaseSection subclass.
+        """
+        self.length[index] = section.length
+        self.grade_angle[index] = section.grade_angle
+        self.start_altitude[index] = section.start[2]
+        self.end_altitude[index] = section.end[2]
+        self.start_speed[index] = section.start_speed
+        self.end_speed[index] = section.end_speed
+        self.average_speed[index] = section.average_speed
+        self.start_time[index] = section.start_time
+        self.end_time[index] = section.end_time
+        self.acceleration[index] = section.acceleration
+        self.total_resistance[index] = section.total_resistance
+
+    @property
+    def duration_time(self) -> np.ndarray:
+        """
+        Duration of each section in seconds.
+        """
+        return self.end_time - self.start_time
+
+    @property
+    def cumulative_distance(self) -> np.ndarray:
+        """
+        Distance travelled at the end of each section in meters.
+        """
+        # Accumulate in float64 so the error does not grow along the route
+        return np.cumsum(self.length, dtype=np.float64)
+
+    @property
+    def instant_power(self) -> np.ndarray:
+        """
+        Instantaneous power of each section in Watts.
+        """
+        return section_power(
+            self.total_resistance, self.length, self.grade_angle, self.duration_time
+        )
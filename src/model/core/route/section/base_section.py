@@ -1,7 +1,6 @@
 import math
 
-from geopy.distance import geodesic
-
+from core.route.distance import haversine
 from core.route.resistance_calculator import ResistanceCalculator
 
 
@@ -10,7 +9,24 @@ class BaseSection:
     Class to represent a section of a route.
     """
 
-    def __init__(self, coordinates, bus, emissions):
+    __slots__ = (
+        "_start",
+        "_end",
+        "length",
+        "bus",
+        "emissions",
+        "_average_speed",
+        "start_speed",
+        "end_speed",
+        "start_time",
+        "end_time",
+        "acceleration",
+        "_grade_angle",
+        "resistance_calculator",
+        "total_resistance",
+    )
+
+    def __init__(self, coordinates, bus, emissions, length=None):
         """
         Initialize a BaseSection with coordinates, bus, and emissions.
 
@@ -18,23 +34,31 @@ class BaseSection:
             coordinates (tuple): A tuple containing 2 tuple: start and end coordinates.
             bus: Instance of the Bus class.
             emissions: Instance of the Emissions class.
+            length (float, optional): Length of the section in meters, when it has
+                already been computed for the whole route.
         """
         self._start = coordinates[0]  # Coordinates for the start of the section
         self._end = coordinates[1]  # Coordinates for the end of the section
+        # Length of the section in meters (great-circle distance)
+        self.length = (
+            length if length is not None else haversine(self._start, self._end)
+        )
 
         self.bus = bus
         self.emissions = emissions
 
         self._average_speed = self._calculate_average_speed()
-        self._acceleration = self._calculate_acceleration()
+        self.acceleration = self._calculate_acceleration()
         self._grade_angle = self.grade_angle
 
         self.resistance_calculator = ResistanceCalculator(
             self.bus,
             self._average_speed,
-            self._acceleration,
+            self.acceleration,
             self._grade_angle,
         )
+        # The resistances do not change once the section is built
+        self.total_resistance = self.resistance_calculator.total_resistance
 
     @property
     def start(self) -> tuple[float, float, float]:
@@ -45,19 +69,11 @@ class BaseSection:
         return self._end
 
     @property
-    def length(self) -> float:
+    def average_speed(self) -> float:
         """
-        Length of the section in meters.
-        Computes the length using the geodesic distance
+        Average speed of the section in m/s.
         """
-
-        # obtain latitude & longitude of start coord
-        lat_0, long_0 = self.start[0], self.start[1]
-        # obtain latitude & longitude of end coord
-        lat_1, long_1 = self.end[0], self.end[1]
-
-        # compute the geodesic distance between them in meters
-        return geodesic((lat_0, long_0), (lat_1, long_1)).meters
+        return self._average_speed
 
     @property
     def grade_angle(self) -> float:
@@ -101,10 +117,6 @@ class BaseSection:
     def rolling_resistance(self) -> float:
         return self.resistance_calculator.rolling_resistance
 
-    @property
-    def total_resistance(self) -> float:
-        return self.resistance_calculator.total_resistance
-
     @property
     def work(self) -> float:
         """
@@ -112,7 +124,7 @@ class BaseSection:
         """
         force = self.total_resistance  # (Newtons)
         distance = self.length  # (meters)
-        return force * distance * math.cos(math.radians(self.grade_angle))
+        return force * distance * math.cos(math.radians(self._grade_angle))
 
     @property
     def instant_power(self) -> float:
@@ -121,56 +133,13 @@ class BaseSection:
         """
         return self.work / self.duration_time  # Watts
 
-    @property
-    def consumption(self) -> dict[str, float]:
-        """
-        Calculate the consumption of the section.
-        Returns:
-            dict: A dictionary with consumption values.
-        """
-        return self.bus.engine.consumption(
-            power=self.instant_power,
-            time=self.duration_time,
-            km=self.length / 1000,
-        )
-
-    @property
-    def section_emissions(self) -> dict[str, float]:
-        """
-        Calculate emissions of the section.
-
-        Returns:
-            dict: A dictionary with emission values in grams per second.
-        """
-
-        power_kw = self.instant_power / 1000  # Convert W to kW
-
-        # gonna be 0 when ElectricalEngine, so will not interfere
-        fuel_consumption_rate = self.consumption["L/km"] / self.duration_time
-
-        return self.emissions.calculate_emissions(
-            power_kw,
-            fuel_consumption_rate=fuel_consumption_rate,
-        )
-    
     @property
     def duration_time(self):
-        return self._end_time - self._start_time
-
-    def get_battery_degradation_in_section(self):
-        return self.bus.get_battery_degradation_in_section()
-
-    def get_battery_state_of_charge(self):
-        return self.bus.get_battery_state_of_charge()
-
-    def get_battery_state_of_health(self):
-        return self.bus.get_battery_state_of_health()
+        return self.end_time - self.start_time
 
     def __str__(self):
-        emissions_str = "\n".join(
-            [f"{k}: {v:.6f} g/s" for k, v in self.section_emissions.items()]
-        )
-
+        # The consumption, emissions and battery state of the section are computed
+        # for the whole route, see Route.describe_sections
         return (
             f"\n---------------------------------------------------"
             f"\nSection from {self.start[0]} º, {self.start[1]} º, {round(self.start[2], 2)} m "
@@ -184,10 +153,5 @@ class BaseSection:
             f"\nTotal Resistance: {self.total_resistance:.2f} N\n"
             f"\nWork: {self.work:.2f} J"
             f"\nRequired Power: {self.instant_power:.2f} W"
-            f"\nConsumption: {self.consumption}"
-            f"\n\nEmissions:\n{emissions_str}"
-            f"\n\nBattery SoC: {self.get_battery_state_of_charge()}"
-            f"\nBattery degradation:{self.get_battery_degradation_in_section()}"
-            f"\nBattery DoD (Health): {self.get_battery_state_of_health()}"
             f"\n"
         )
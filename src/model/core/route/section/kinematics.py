@@ -0,0 +1,59 @@
+import math
+
+from utils.jit import njit
+
+
+@njit(cache=True, fastmath=True)
+def calculate_end_speed(limit, dist, start_speed, effective_max_acceleration, effective_max_deceleration):
+    """
+    Determine the start speed, end speed and acceleration of a simulated section.
+
+    When the speed limit cannot be met under the effective acceleration or deceleration,
+    the speeds are clamped analytically:
+        - stop:       v0 <= sqrt(2 * |a_max| * d)
+        - decelerate: v0 <= sqrt(limit^2 + 2 * |a_max| * d)
+        - accelerate: vf <= sqrt(v0^2 + 2 * |a_max| * d)
+
+    Args:
+        limit (float): Speed limit of the section (m/s).
+        dist (float): Length of the section (m).
+        start_speed (float): Speed at the beginning of the section (m/s).
+        effective_max_acceleration (float): Maximum acceleration allowed (m/s²).
+        effective_max_deceleration (float): Maximum deceleration allowed (m/s²).
+
+    Returns:
+        tuple: (start_speed, end_speed, acceleration). The start speed may have been
+        reduced, and the acceleration is 0 when the bus keeps a constant speed.
+    """
+    if limit == start_speed:
+        return start_speed, limit, 0.0
+
+    # Work with squared speeds so each one is computed once and the square root
+    # is only taken for the speed that gets clamped. Every bound has the form
+    # v^2 + |a| * 2d, which fastmath lets LLVM contract into a single FMA
+    start_speed_sq = start_speed * start_speed
+    two_dist = 2.0 * dist
+    if limit == 0:
+        end_speed = 0.0
+        end_speed_sq = 0.0
+        max_start_speed_sq = abs(effective_max_deceleration) * two_dist
+        if start_speed_sq > max_start_speed_sq:
+            start_speed_sq = max_start_speed_sq
+            start_speed = math.sqrt(max_start_speed_sq)
+    elif limit < start_speed:
+        end_speed = limit
+        end_speed_sq = limit * limit
+        max_start_speed_sq = end_speed_sq + abs(effective_max_deceleration) * two_dist
+        if start_speed_sq > max_start_speed_sq:
+            start_speed_sq = max_start_speed_sq
+            start_speed = math.sqrt(max_start_speed_sq)
+    else:
+        end_speed = limit
+        end_speed_sq = limit * limit
+        max_end_speed_sq = start_speed_sq + abs(effective_max_acceleration) * two_dist
+        if end_speed_sq > max_end_speed_sq:
+            end_speed_sq = max_end_speed_sq
+            end_speed = math.sqrt(max_end_speed_sq)
+
+    acceleration = (end_speed_sq - start_speed_sq) / two_dist
+    return start_speed, end_speed, acceleration
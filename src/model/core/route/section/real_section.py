@@ -6,6 +6,8 @@ class RealSection(BaseSection):
     Class to represent a real section of a route, inheriting from BaseSection.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinates: tuple[tuple[float, float, float], tuple[float, float, float]],
@@ -13,6 +15,7 @@ class RealSection(BaseSection):
         timestamps: tuple[float, float],
         bus,
         emissions,
+        length: float = None,
     ):
         """
         Initialize a RealSection with coordinates, speeds, timestamps, bus, and emissions.
@@ -23,30 +26,12 @@ class RealSection(BaseSection):
             timestamps (tuple): A tuple containing start and end times.
             bus: Instance of the Bus class.
             emissions: Instance of the Emissions class.
+            length (float, optional): Length of the section in meters.
         """
-        self._coordinates = coordinates
-
-        self._start_speed = speeds[0]
-        self._end_speed = speeds[1]
-
-        self._start_time = timestamps[0]
-        self._end_time = timestamps[1]
-
-        super().__init__(coordinates, bus, emissions)
+        self.start_speed = speeds[0]
+        self.end_speed = speeds[1]
 
-    @property
-    def start_speed(self):
-        return self._start_speed
+        self.start_time = timestamps[0]
+        self.end_time = timestamps[1]
 
-    @property
-    def end_speed(self):
-        return self._end_speed
-    
-    @property
-    def start_time(self):
-        return self._start_time
-    
-    @property
-    def end_time(self):
-        return self._end_time
-    
+        super().__init__(coordinates, bus, emissions, length)
@@ -1,12 +1,15 @@
 from core.route.section.base_section import BaseSection
+from core.route.section.kinematics import calculate_end_speed
 from utils.constants import MAX_ACCELERATION, MAX_DECELERATION
 
 class SimulatedSection(BaseSection):
     """
     Represents a section of a route that has been simulated.
     """
+
+    __slots__ = ("_speed_limit", "_resistance_per_mass")
     
-    def __init__(self, coordinates, speed_limit, start_speed, start_time, bus, emissions):
+    def __init__(self, coordinates, speed_limit, start_speed, start_time, bus, emissions, length=None):
         """
         Initialize a SimulatedSection with coordinates, bus, emissions, a single speed limit, 
         start speed, and start time.
@@ -18,18 +21,19 @@ class SimulatedSection(BaseSection):
             start_time (float): Time at the beginning of the section (s).
             bus: Instance of the Bus class.
             emissions: Instance of the Emissions class.
+            length (float, optional): Length of the section (m).
         """
         self._speed_limit = speed_limit / 3.6  # Convert km/h to m/s
-        self._start_speed = start_speed
-        self._start_time = start_time
-        self._end_speed = 0.0
-        self._end_time = 0.0
-        self.velocities = []          # List of average velocities
-        self.start_times = []         # List of start times
-        self.end_times = []           # List of end times
+        self.start_speed = start_speed
+        self.start_time = start_time
+        self.end_speed = 0.0
+        self.end_time = 0.0
         
         # Call base class to initialize necessary attributes
-        super().__init__(coordinates, bus, emissions)
+        super().__init__(coordinates, bus, emissions, length)
+
+        # Resistance per unit of mass (m/s²), computed once for the section
+        self._resistance_per_mass = self.total_resistance / self.bus.mass
         
         # Process the section
         self._process()
@@ -42,143 +46,31 @@ class SimulatedSection(BaseSection):
         # Calculate effective acceleration and deceleration based on total resistance
         effective_max_acceleration, effective_max_deceleration = self._calculate_effective_forces()
         
-        # Calculate end speed based on the speed limit and start speed
-        self._end_speed, decel, accel = self._calculate_end_speed(limit, dist, effective_max_acceleration, effective_max_deceleration)
-
-        self._acceleration = self._set_acceleration(decel, accel)
-        
-        # Calculate the time required to traverse the section
-        self._end_time = self._calculate_time(decel, accel, dist)
+        # Calculate end speed and acceleration based on the speed limit and start speed
+        self.end_speed, self.acceleration = self._calculate_end_speed(limit, dist, effective_max_acceleration, effective_max_deceleration)
         
-        # Calculate and store the average speed
-        avg_speed = self._calculate_average_speed()  
-        self.velocities.append(avg_speed)
-        self.start_times.append(self._start_time)
-        self.end_times.append(self._end_time)
+        # Calculate the average speed and, from it, the time required to traverse the
+        # section: under constant acceleration t = d / avg_speed = 2d / (vi + vf)
+        self._average_speed = self._calculate_average_speed()
+        self.end_time = self.start_time + dist / max(self._average_speed, 0.1)
 
     def _calculate_effective_forces(self):
         """Calculate effective acceleration and deceleration based on the total resistance."""
-        total_resistance = self.total_resistance  # N
-        effective_max_acceleration = MAX_ACCELERATION - (total_resistance / self.bus.mass)
-        effective_max_deceleration = MAX_DECELERATION + (total_resistance / self.bus.mass)
+        effective_max_acceleration = MAX_ACCELERATION - self._resistance_per_mass
+        effective_max_deceleration = MAX_DECELERATION + self._resistance_per_mass
         return effective_max_acceleration, effective_max_deceleration
 
-    def _decelerate_to_stop(self, dist, effective_max_deceleration, step_size=1.0):
-        """Handles the case where the speed must be reduced to zero by reducinng the
-        initial speed while the calculated deceleration is greater than the maximum deceleration allowed."""
-        self._end_speed = 0
-        decel = self._calculate_instant_acceleration(self._start_speed, self._end_speed, dist)
-        while abs(decel) > abs(effective_max_deceleration):
-            if self._start_speed - step_size >= 0:
-                self._start_speed -= step_size
-            decel = (-self._start_speed**2) / (2 * dist)
-        return decel, None
-
-    def _decelerate(self, limit, dist, effective_max_deceleration, step_size=1.0):
-        """Handles the case where the speed must be reduced to a certain limit by reducing the
-        initial speed while the calculated deceleration is greater than the maximum deceleration allowed."""
-        self._end_speed = limit
-        decel = self._calculate_instant_acceleration(self._start_speed, self._end_speed, dist)
-        while abs(decel) > abs(effective_max_deceleration):
-            if self._end_speed - step_size >= 0:
-                self._end_speed -= step_size
-            if self._start_speed - step_size >= 0:
-                self._start_speed -= step_size
-            decel = (self._end_speed**2 - self._start_speed**2) / (2 * dist)
-        return decel, None
-
-    def _accelerate(self, limit, dist, effective_max_acceleration, step_size=1.0):
-        """Handles the case where the speed must be increased to a certain limit by accelerating the
-        necessary amount if the calculated acceleration is under the maximum acceleration allowed. When
-        not, the speed is reduced until the acceleration is under the maximum allowed."""
-        self._end_speed = limit
-        accel = self._calculate_instant_acceleration(self._start_speed, self._end_speed, dist)
-        while abs(accel) > abs(effective_max_acceleration):
-            if self._end_speed - step_size >= 0:
-                self._end_speed -= step_size
-            if self._start_speed - step_size >= 0:
-                self._start_speed -= step_size
-            accel = (self._end_speed**2 - self._start_speed**2) / (2 * dist)
-        return None, accel
-
     def _calculate_end_speed(self, limit, dist, effective_max_acceleration, effective_max_deceleration):
-        """Determine the end speed, and possible acceleration or deceleration."""
-        if limit == 0:
-            decel, accel = self._decelerate_to_stop(dist, effective_max_deceleration)
-        elif limit < self._start_speed:
-            decel, accel = self._decelerate(limit, dist, effective_max_deceleration)
-        elif limit > self._start_speed:
-            decel, accel = self._accelerate(limit, dist, effective_max_acceleration)
-        else:
-            self._end_speed = limit
-            decel, accel = None, None
-
-        # Return the final end speed, deceleration, and acceleration
-        return self._end_speed, decel, accel
-    
-    def _calculate_instant_acceleration(self, start_speed, end_speed, dist):
-        """Calculate the instantaneous acceleration for the section."""
-        return (end_speed**2 - start_speed**2) / (2 * dist)
-
-    def _set_acceleration(self, decel, accel):
-        """Set the acceleration based on the deceleration and acceleration values."""
-        if accel is not None and decel is None:
-            return accel
-        elif decel is not None and accel is None:
-            return decel
-        else:
-            return 0.0
-
-    def _calculate_time(self, decel, accel, dist):
-        """Calculate the time required to traverse the section."""
-        if decel is not None and decel < 0:
-            time = (self._start_speed - self._end_speed) / abs(decel)  # t = (vi - vf) / |a|
-        elif accel is not None and accel > 0:
-            time = (self._end_speed - self._start_speed) / accel
-        else:
-            time = dist / max(self._start_speed, 0.1)
-        
-        return self._start_time + time
-    
-    @property
-    def acceleration(self):
-        return self._acceleration
-    
-    @acceleration.setter
-    def acceleration(self, value):
-        self._acceleration = value
-
-    @property
-    def start_speed(self):
-        return self._start_speed
-    
-    @start_speed.setter
-    def start_speed(self, value):
-        self._start_speed = value
-
-    @property
-    def end_speed(self):
-        return self._end_speed
-    
-    @end_speed.setter
-    def end_speed(self, value):
-        self._end_speed = value
-
-    @property
-    def start_time(self):
-        return self._start_time
-    
-    @start_time.setter
-    def start_time(self, value):
-        self._start_time = value
-
-    @property
-    def end_time(self):
-        return self._end_time
-    
-    @end_time.setter
-    def end_time(self, value):
-        self._end_time = value
+        """Determine the end speed and the acceleration (negative when decelerating).
+        The start speed is reduced when the section does not allow reaching the limit."""
+        self.start_speed, end_speed, acceleration = calculate_end_speed(
+            limit,
+            dist,
+            float(self.start_speed),  # may be an int for the first section
+            effective_max_acceleration,
+            effective_max_deceleration,
+        )
+        return end_speed, acceleration
 
     def __str__(self):
         return (
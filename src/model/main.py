@@ -1,27 +1,103 @@
+import argparse
+import logging
 import os
-from time import time
+from pathlib import Path
+from time import perf_counter
 
-from config import bus_instance, emissions_instance
+import numpy as np
+
+from config import ELECTRIC, ENGINE_BUILDERS, create_bus, emissions_instance
+from core.bus.engine.degradation import degradation_step, degradation_steps
 from core.model import Model
+from core.route.route_arrays import RouteArrays
+from core.route.section.kinematics import calculate_end_speed
+from paths import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Calculate the consumption and emissions of a bus route."
+    )
+    parser.add_argument(
+        "--name",
+        default="linea_d2_algoritmo_simulation",
+        help="Name of the model, used for the output directory.",
+    )
+    parser.add_argument(
+        "--data",
+        default=None,
+        help="Path to the input CSV file. Defaults to <repo>/data/<name>.csv.",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=("real", "simulation"),
+        default="simulation",
+        help="Use the recorded speeds ('real') or simulate them from the limits.",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=tuple(ENGINE_BUILDERS),
+        default="electric" if ELECTRIC else "fuel",
+        help="Type of engine of the bus.",
+    )
+    parser.add_argument(
+        "--plots",
+        action="store_true",
+        help="Also save the combined profiles and the route map.",
+    )
+    return parser.parse_args(argv)
+
+
+def warmup():
+    """
+    Compile (or load from the cache) the numba kernels with a dummy section,
+    so the first call inside the timed run does not pay for it.
+    """
+    calculate_end_speed(10.0, 10.0, 5.0, 1.0, -1.0)
+    # Through RouteArrays so section_power gets the dtypes of the real arrays
+    RouteArrays(1).instant_power
+    ones = np.ones(1)
+    degradation_step(100.0, 0.01, 1.0, 100.0, 100.0, 1 / 3000, 1e-5, 0.0)
+    degradation_steps(ones, ones, 100.0, 100.0, 100.0, 1 / 3000, 1e-5, 0.0)
 
 
-def main():
-    start_time = time()
+def main(argv=None):
+    args = parse_args(argv)
 
-    data = os.path.join("data", "linea_d2_algoritmo_simulation.csv")
+    data = Path(args.data) if args.data else DATA_DIR / f"{args.name}.csv"
+    # Fail before the warmup and the model setup if the file is missing
+    if not data.is_file():
+        raise FileNotFoundError(f"Data file not found: {data}")
+
+    warmup_start = perf_counter()
+    warmup()
+    logger.info("Tiempo warmup: %s", perf_counter() - warmup_start)
+
+    start_time = perf_counter()
 
     model = Model(
-        name="linea_d2_algoritmo_simulation",
-        filepath=data,
-        bus=bus_instance,
+        name=args.name,
+        filepath=str(data),
+        bus=create_bus(args.engine),
         emissions=emissions_instance,
-        mode="simulation",
+        mode=args.mode,
     )
 
     model.consumption_and_emissions()
 
-    print(f"Tiempo ejecucion: {time() - start_time}")
+    # Building every section string is costly, so only do it when it is shown
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\n".join(model.route.describe_sections()))
+
+    if args.plots:
+        model.plot_combined_profiles()
+        model.plot_map()
+
+    logger.info("Tiempo ejecucion: %s", perf_counter() - start_time)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "WARNING"))
     main()
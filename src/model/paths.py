@@ -0,0 +1,6 @@
+from pathlib import Path
+
+# Raíz del repositorio (src/model/paths.py -> ../..)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+DATA_DIR = PROJECT_ROOT / "data"
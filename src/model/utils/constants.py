@@ -1,6 +1,8 @@
 AIR_DENSITY = 1.225
 CO2_CONVERSION_FACTOR = 2.64
+EARTH_RADIUS = 6371008.8  # m, mean radius
 GRAVITY = 9.81
+HOURS_PER_SECOND = 1 / 3600
 MAX_ACCELERATION = 1.5  # m/s^2
 MAX_DECELERATION = -1.0  # m/s^2, note this is negative
 
@@ -0,0 +1,10 @@
+try:
+    from numba import njit, prange
+except ImportError:
+    # Without numba the kernels run as plain Python functions
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+    prange = range
@@ -0,0 +1,70 @@
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src" / "model"))
+
+from core.bus.engine.battery import Battery  # noqa: E402
+
+
+def create_battery():
+    return Battery(
+        initial_capacity_ah=1225,
+        voltage_v=400,
+        max_cycles=3000,
+        initial_soc_percent=100,
+        min_state_of_health=80,
+    )
+
+
+class TestStepMany(unittest.TestCase):
+    """`step_many` must match `update_soc_and_degradation` bit for bit."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # Charge and discharge, with some sections without duration
+        self.ah_transferred = rng.normal(0.5, 2.0, 1000)
+        self.time_seconds = rng.uniform(1.0, 20.0, 1000)
+        self.time_seconds[::97] = 0.0
+
+    def test_same_state_as_scalar_steps(self):
+        scalar = create_battery()
+        degradation = []
+        state_of_charge = []
+        for ah, time in zip(self.ah_transferred.tolist(), self.time_seconds.tolist()):
+            scalar.update_soc_and_degradation(ah, time)
+            degradation.append(scalar.degradation_in_section)
+            state_of_charge.append(scalar.state_of_charge_percent)
+
+        batch = create_battery()
+        batch_degradation, batch_state_of_charge = batch.step_many(
+            self.ah_transferred, self.time_seconds
+        )
+
+        self.assertEqual(batch_degradation.tolist(), degradation)
+        self.assertEqual(batch_state_of_charge.tolist(), state_of_charge)
+        self.assertEqual(batch.state_of_charge_percent, scalar.state_of_charge_percent)
+        self.assertEqual(batch.current_capacity_ah, scalar.current_capacity_ah)
+        self.assertEqual(batch.state_of_health, scalar.state_of_health)
+        self.assertEqual(batch.degradation_in_section, scalar.degradation_in_section)
+
+    def test_drained_battery_warns_once(self):
+        battery = create_battery()
+        with self.assertLogs("core.bus.engine.battery", "WARNING") as logs:
+            battery.step_many(np.full(10, 500.0), np.full(10, 10.0))
+        self.assertEqual(len(logs.output), 1)
+        self.assertEqual(battery.state_of_charge_percent, 0.0)
+
+    def test_no_sections(self):
+        battery = create_battery()
+        degradation, state_of_charge = battery.step_many([], [])
+        self.assertEqual(len(degradation), 0)
+        self.assertEqual(len(state_of_charge), 0)
+        self.assertEqual(battery.state_of_charge_percent, 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import math
+import sys
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src" / "model"))
+
+from core.route.section.kinematics import calculate_end_speed  # noqa: E402
+
+MAX_ACCELERATION = 1.0
+MAX_DECELERATION = -1.0
+
+
+class TestCalculateEndSpeed(unittest.TestCase):
+    """Expected values from v_f^2 = v_0^2 + 2 * a * d over a 10 m section."""
+
+    def assertSpeeds(self, result, expected):
+        for value, expected_value in zip(result, expected):
+            self.assertAlmostEqual(value, expected_value, places=12)
+
+    def _end_speed(self, limit, start_speed):
+        return calculate_end_speed(
+            limit, 10.0, start_speed, MAX_ACCELERATION, MAX_DECELERATION
+        )
+
+    def test_constant_speed(self):
+        self.assertSpeeds(self._end_speed(10.0, 10.0), (10.0, 10.0, 0.0))
+
+    def test_stop(self):
+        self.assertSpeeds(self._end_speed(0.0, 2.0), (2.0, 0.0, -0.2))
+
+    def test_stop_clamps_start_speed(self):
+        # v0 <= sqrt(2 * 1 * 10)
+        self.assertSpeeds(self._end_speed(0.0, 10.0), (math.sqrt(20.0), 0.0, -1.0))
+
+    def test_decelerate(self):
+        self.assertSpeeds(self._end_speed(5.0, 6.0), (6.0, 5.0, -0.55))
+
+    def test_decelerate_clamps_start_speed(self):
+        # v0 <= sqrt(5^2 + 2 * 1 * 10)
+        self.assertSpeeds(self._end_speed(5.0, 10.0), (math.sqrt(45.0), 5.0, -1.0))
+
+    def test_accelerate(self):
+        self.assertSpeeds(self._end_speed(5.0, 4.0), (4.0, 5.0, 0.45))
+
+    def test_accelerate_clamps_end_speed(self):
+        # vf <= sqrt(0^2 + 2 * 1 * 10)
+        self.assertSpeeds(self._end_speed(10.0, 0.0), (0.0, math.sqrt(20.0), 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
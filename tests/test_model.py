@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src" / "model"))
+
+from config import create_bus, emissions_instance  # noqa: E402
+from core.bus.engine.degradation import degradation_step  # noqa: E402
+from core.model import Model  # noqa: E402
+
+
+class TestRealMode(unittest.TestCase):
+    """linea_d2.csv has points recorded with repeated timestamps."""
+
+    def setUp(self):
+        # The model writes to outputs/<name> relative to the working directory
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _run(self, engine):
+        model = Model(
+            name="linea_d2",
+            filepath=str(PROJECT_ROOT / "data" / "linea_d2.csv"),
+            bus=create_bus(engine),
+            emissions=emissions_instance,
+            mode="real",
+        )
+        model.consumption_and_emissions()
+        output = np.genfromtxt(
+            os.path.join("outputs", "linea_d2", "output.csv"),
+            delimiter=";",
+            skip_header=1,
+            usecols=range(2, 16),
+        )
+        return model, output
+
+    def test_electric_engine(self):
+        model, output = self._run("electric")
+        self.assertGreater(len(output), 0)
+        self.assertTrue(np.isfinite(output).all())
+        self.assertTrue((model.route.arrays.duration_time > 0).all())
+
+    def test_fuel_engine(self):
+        _, output = self._run("fuel")
+        self.assertGreater(len(output), 0)
+        self.assertTrue(np.isfinite(output).all())
+
+
+class TestDegradationStep(unittest.TestCase):
+    def test_zero_duration(self):
+        soc, cycles, capacity, degradation = degradation_step(
+            100.0, 0.01, 0.0, 100.0, 100.0, 1 / 3000, 1e-5, 0.0
+        )
+        self.assertTrue(np.isfinite([soc, cycles, capacity, degradation]).all())
+
+
+if __name__ == "__main__":
+    unittest.main()